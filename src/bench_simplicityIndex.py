@@ -0,0 +1,157 @@
+
+# ================================================================================================================================================================================================
+# INSTRUCTIONS
+"""
+Benchmarks for the simplicity scorer, on the stub articles in util_simplicityIndex plus synthetic long documents.
+
+    python src/bench_simplicityIndex.py
+    python src/bench_simplicityIndex.py --model regex --sizes 500 2000 8000 --json ./results/bench.json
+
+Reports, for flesch_reading_ease, dale_chall, ari, composite_index and composite_index_batch:
+docs/sec, tokens/sec (whitespace-separated tokens) and peak traced memory; then the same per function as
+the document grows, and where composite_index spends its time per stage (sentence split, tokenize, syllables, lexicon).
+Save the --json output from a known-good commit and compare against it to catch regressions.
+"""
+
+
+# ================================================================================================================================================================================================
+# FUNCTIONS
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+import util_simplicityIndex as si
+
+def synthetic_document(n_tokens, seed=0):
+    """
+    Returns a document of about n_tokens tokens, made of sentences drawn at random from the stub articles
+    """
+    sentences = [s.strip() for _, text in si.sample_articles() for s in text.split(". ") if len(s.split()) >= 3]
+    rng = random.Random(seed)
+    picked, size = [], 0
+    while size < n_tokens:
+        sentence = rng.choice(sentences)
+        picked.append(sentence)
+        size += len(sentence.split())
+    return ". ".join(picked) + "."
+
+def count_tokens(texts):
+    return sum(len(text.split()) for text in texts)
+
+def _run(function, texts, batch):
+    if batch:
+        function(texts)
+    else:
+        for text in texts:
+            function(text)
+
+def time_function(function, texts, repeat=3, batch=False):
+    """
+    Returns the best wall time (seconds) of scoring all texts, over `repeat` runs
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run(function, texts, batch)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(function, texts, batch=False):
+    """
+    Returns the peak Python memory (bytes) traced while scoring all texts once
+    """
+    tracemalloc.start()
+    try:
+        _run(function, texts, batch)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+FUNCTIONS = [
+    ("flesch_reading_ease", si.flesch_reading_ease, False),
+    ("dale_chall", si.dale_chall, False),
+    ("ari", si.ari, False),
+    ("composite_index", si.composite_index, False),
+    ("composite_index_batch", si.composite_index_batch, True),
+]
+
+def bench_functions(texts, repeat=3):
+    results = []
+    tokens = count_tokens(texts)
+    for name, function, batch in FUNCTIONS:
+        seconds = time_function(function, texts, repeat, batch)
+        results.append({
+            "function": name,
+            "docs": len(texts),
+            "seconds": seconds,
+            "docs_per_sec": len(texts) / seconds,
+            "tokens_per_sec": tokens / seconds,
+            "peak_memory_mb": peak_memory(function, texts, batch) / 2**20,
+        })
+    return results
+
+def bench_scaling(sizes, repeat=3):
+    results = []
+    for size in sizes:
+        texts = [synthetic_document(size)]
+        tokens = count_tokens(texts)
+        for name, function, batch in FUNCTIONS:
+            seconds = time_function(function, texts, repeat, batch)
+            results.append({
+                "function": name,
+                "tokens": tokens,
+                "seconds": seconds,
+                "tokens_per_sec": tokens / seconds,
+                "peak_memory_mb": peak_memory(function, texts, batch) / 2**20,
+            })
+    return results
+
+def bench_stages(texts):
+    with si.profiling() as profiler:
+        for text in texts:
+            si.composite_index(text)
+    return profiler
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the simplicity index scorer.")
+    parser.add_argument("--model", default=si.DEFAULT_MODEL, help='spaCy model name, or "regex"')
+    parser.add_argument("--lexicon", help="path to the Dale-Chall easy word list")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per measurement (best is kept)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[250, 1000, 4000, 16000], help="synthetic document sizes, in tokens")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    si.set_model(args.model)
+    si.set_lexicon(args.lexicon)
+    si.set_cache(None)
+
+    texts = [text for _, text in si.sample_articles()]
+    si.composite_index(texts[0])  # load the model, lexicon and warm the syllable table before timing
+
+    functions = bench_functions(texts, args.repeat)
+    scaling = bench_scaling(args.sizes, args.repeat)
+    profiler = bench_stages(texts)
+
+    print(f"model: {si.get_backend().name}, {len(texts)} stub articles, {count_tokens(texts)} tokens")
+    print(f"\n{'function':<24}{'docs/sec':>10}{'tokens/sec':>12}{'peak MB':>10}")
+    for row in functions:
+        print(f"{row['function']:<24}{row['docs_per_sec']:>10.1f}{row['tokens_per_sec']:>12.0f}{row['peak_memory_mb']:>10.2f}")
+
+    print(f"\n{'function':<24}{'tokens':>8}{'sec/doc':>10}{'tokens/sec':>12}{'peak MB':>10}   (synthetic documents)")
+    for row in scaling:
+        print(f"{row['function']:<24}{row['tokens']:>8}{row['seconds']:>10.4f}{row['tokens_per_sec']:>12.0f}{row['peak_memory_mb']:>10.2f}")
+
+    print("\ncomposite_index stages (stub articles):")
+    print(profiler.summary())
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"model": si.get_backend().name, "functions": functions, "scaling": scaling, "stages": profiler.report()}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+
+# ================================================================================================================================================================================================
+# INSTRUCTIONS
+"""
+Command line scorer for the simplicity index. Streams documents, scores them in a process pool and appends
+rows to the output as it goes, so a crash only loses the chunk in flight and a rerun skips what is already scored.
+
+    python src/scoring_simplicityIndex.py ./results/Given_Summaries/ -o ./results/given_si.csv
+    cat articles.jsonl | python src/scoring_simplicityIndex.py - -o ./results/articles_si.parquet
+
+Input is either a directory of .txt files (id = file name) or "-" for JSONL on stdin, one {"id": ..., "text": ...} per line.
+Output is CSV, or Parquet when the path ends with .parquet (a directory of part files, needs pyarrow).
+Columns: id, flesch, dale, ari, index (raw Flesch / Dale-Chall / ARI scores and the composite index).
+Ids that finished are appended to a checkpoint file (default: <output>.checkpoint) after their rows are written.
+"""
+
+
+# ================================================================================================================================================================================================
+# FUNCTIONS
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+import util_simplicityIndex as si
+
+COLUMNS = ["id", "flesch", "dale", "ari", "index"]
+
+def iter_directory(path):
+    """
+    Yields (id, file path, None) for every .txt file in path, sorted by name. Files are read by the workers.
+    """
+    for name in sorted(f for f in os.listdir(path) if f.endswith(".txt")):
+        yield name, os.path.join(path, name), None
+
+def iter_jsonl(stream, id_field="id", text_field="text"):
+    """
+    Yields (id, None, text) for every JSONL line. Lines without an id get "line N", N being their line number.
+    A line that cannot be read yields (id, error message) instead, which is reported like a scoring failure.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        doc_id = f"line {line_number}"
+        try:
+            record = json.loads(line)
+            if id_field in record:
+                doc_id = str(record[id_field])
+            text = record[text_field]
+            if not isinstance(text, str):
+                raise TypeError(f"{text_field!r} is not a string")
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            yield doc_id, f"{type(e).__name__}: {e}"
+            continue
+        yield doc_id, None, text
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+def score_item(item):
+    """
+    Returns a row for one (id, path, text) item, or (id, error message) if the document could not be scored.
+    Items that are already (id, error message) are passed through.
+    """
+    if len(item) == 2:
+        return item
+    doc_id, path, text = item
+    try:
+        if text is None:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        stats = si.text_stats(text)
+        # the metrics return int 0 for empty text and clipped ARI, keep every score a float
+        scores = [si.flesch_reading_ease(stats), si.dale_chall(stats), si.ari(stats), si.composite_index(stats)]
+        return [doc_id, *map(float, scores)]
+    except Exception as e:
+        return doc_id, f"{type(e).__name__}: {e}"
+
+class CsvSink:
+    def __init__(self, path):
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.f = open(path, "a", newline="", encoding="utf-8")
+        self.writer = csv.writer(self.f)
+        if new_file:
+            self.writer.writerow(COLUMNS)
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def close(self):
+        self.f.close()
+
+class ParquetSink:
+    """
+    Writes each chunk as its own complete part file, so a crash never leaves a file without a footer
+    """
+
+    def __init__(self, path):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from None
+        self.pa, self.pq = pyarrow, pyarrow.parquet
+        # fixed column types, so every part file reads back as one dataset
+        self.schema = pyarrow.schema([("id", pyarrow.string())] + [(name, pyarrow.float64()) for name in COLUMNS[1:]])
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def write(self, rows):
+        table = self.pa.table({name: list(values) for name, values in zip(COLUMNS, zip(*rows))}, schema=self.schema)
+        self.pq.write_table(table, os.path.join(self.path, f"part-{time.time_ns()}.parquet"))
+
+    def close(self):
+        pass
+
+def score_stream(items, sink, checkpoint_path, processes=1, chunk_size=256, model=si.DEFAULT_MODEL, lexicon=None, inflections=False, cache=None):
+    """
+    Scores items chunk by chunk, skipping ids already in the checkpoint. Returns (scored, skipped, failed) counts.
+
+    # Notes
+    Only one chunk of documents is held in memory at a time. Rows are written before their ids are checkpointed,
+    so a crash between the two can repeat at most one chunk of rows on the next run.
+    """
+    done = load_checkpoint(checkpoint_path)
+    scored = skipped = failed = 0
+
+    def pending():
+        nonlocal skipped
+        for item in items:
+            if item[0] in done:
+                skipped += 1
+                continue
+            yield item
+
+    initargs = (model, lexicon, inflections, cache)
+    if processes == 1:
+        si.configure(*initargs)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(processes, initializer=si.configure, initargs=initargs)
+
+    pending_items = pending()
+    try:
+        with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+            while True:
+                chunk = list(itertools.islice(pending_items, chunk_size))
+                if not chunk:
+                    break
+                results = pool.map(score_item, chunk) if pool else [score_item(item) for item in chunk]
+
+                rows = []
+                for result in results:
+                    if isinstance(result, tuple):
+                        print(f"skipping {result[0]}: {result[1]}", file=sys.stderr)
+                        failed += 1
+                    else:
+                        rows.append(result)
+                if rows:
+                    sink.write(rows)
+                    checkpoint.writelines(f"{row[0]}\n" for row in rows)
+                    checkpoint.flush()
+                scored += len(rows)
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        sink.close()
+
+    return scored, skipped, failed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score documents with the simplicity index (Flesch, Dale-Chall, ARI, composite).")
+    parser.add_argument("input", help='directory of .txt files, or "-" for JSONL on stdin')
+    parser.add_argument("-o", "--output", required=True, help="output .csv file, or .parquet directory")
+    parser.add_argument("--checkpoint", help="file of finished ids (default: <output>.checkpoint)")
+    parser.add_argument("-p", "--processes", type=int, default=os.cpu_count(), help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="documents scored and written per step")
+    parser.add_argument("--model", default=si.DEFAULT_MODEL, help='spaCy model name, or "regex"')
+    parser.add_argument("--lexicon", help="path to the Dale-Chall easy word list")
+    parser.add_argument("--inflections", action="store_true", help="count regular inflections of easy words as easy")
+    parser.add_argument("--cache", help="SQLite score cache shared across runs and workers")
+    parser.add_argument("--id-field", default="id", help="JSONL id field")
+    parser.add_argument("--text-field", default="text", help="JSONL text field")
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        items = iter_jsonl(sys.stdin, args.id_field, args.text_field)
+    else:
+        items = iter_directory(args.input)
+
+    output = args.output.rstrip("/\\")
+    sink = ParquetSink(output) if output.endswith(".parquet") else CsvSink(output)
+    checkpoint_path = args.checkpoint or output + ".checkpoint"
+
+    scored, skipped, failed = score_stream(
+        items, sink, checkpoint_path,
+        processes=max(args.processes, 1), chunk_size=args.chunk_size,
+        model=args.model, lexicon=args.lexicon, inflections=args.inflections, cache=args.cache,
+    )
+    print(f"scored {scored}, skipped {skipped} already done, failed {failed}", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+
+# ================================================================================================================================================================================================
+# INSTRUCTIONS
+"""
+Local HTTP/JSON scoring service. Concurrent requests are gathered into micro-batches and scored by a pool
+of worker processes, each holding one warm model, so many clients share the model instead of loading their own.
+
+    python src/server_simplicityIndex.py --port 8000 --workers 2 --max-batch-size 32 --max-wait-ms 5
+
+Endpoints:
+- POST /score    {"text": "..."} -> {"flesch": ..., "dale": ..., "ari": ..., "index": ...}
+                 {"texts": ["...", ...]} -> {"scores": [{...}, ...]}
+- GET  /health   {"status": "ok", "model": ..., "workers": ...}
+- GET  /metrics  queue depth, in-flight batches, batch sizes and request latency percentiles
+
+A batch closes when it reaches --max-batch-size texts or --max-wait-ms after its first text arrived, whichever is first.
+Batches go through `composite_index_batch`'s pipeline (sentencizer), so scores can differ slightly from `composite_index`.
+"""
+
+
+# ================================================================================================================================================================================================
+# FUNCTIONS
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import util_simplicityIndex as si
+
+MAX_BODY_BYTES = 10 * 2**20
+
+def _init_worker(model, lexicon, inflections, cache):
+    si.configure(model, lexicon, inflections, cache)
+    # load everything now, so the first request does not pay for it
+    si.composite_index_batch(["Warm up the model. It is ready now."])
+
+def score_texts(texts):
+    """
+    Returns a {flesch, dale, ari, index} dict per text. Runs inside a worker process.
+    """
+    rows = []
+    for stats in si.text_stats_batch(texts, batch_size=max(len(texts), 1)):
+        rows.append({
+            "flesch": si.flesch_reading_ease(stats),
+            "dale": si.dale_chall(stats),
+            "ari": si.ari(stats),
+            "index": si.composite_index(stats),
+        })
+    return rows
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+class QueueFull(Exception):
+    pass
+
+class MicroBatcher:
+    """
+    Collects texts submitted by concurrent requests into batches and runs them on an executor.
+
+    # Notes
+    At most `max_in_flight` batches run at once (one per worker). A batch is only collected once a worker is free,
+    so while all workers are busy new texts wait in the queue and go out together: batches grow with load.
+    """
+
+    def __init__(self, executor, score=score_texts, max_batch_size=32, max_wait=0.005, max_in_flight=1, max_queue=10_000):
+        self.executor = executor
+        self.score = score
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.queue = asyncio.Queue()
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+        self.batches = 0
+        self.texts = 0
+        self.batch_sizes = deque(maxlen=10_000)
+        self._task = None
+        self._dispatches = set()
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, texts):
+        """
+        Queues texts and returns their scores once their batch has run
+        """
+        if self.queue.qsize() + len(texts) > self.max_queue:
+            raise QueueFull()
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in texts]
+        for text, future in zip(texts, futures):
+            self.queue.put_nowait((text, future))
+        return await asyncio.gather(*futures)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # wait for a free worker first, so the batch picks up everything that queued meanwhile
+            await self.slots.acquire()
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # drain anything that arrived meanwhile, without waiting
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # keep a reference so the task is not garbage collected while it runs
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch):
+        self.in_flight += 1
+        try:
+            texts = [text for text, _ in batch]
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, self.score, texts)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            self.in_flight -= 1
+            self.slots.release()
+            self.batches += 1
+            self.texts += len(batch)
+            self.batch_sizes.append(len(batch))
+
+class ScoringServer:
+    """
+    Minimal HTTP/1.1 server (keep-alive, Content-Length bodies only) in front of a MicroBatcher
+    """
+
+    def __init__(self, batcher, model_name="", workers=1):
+        self.batcher = batcher
+        self.model_name = model_name
+        self.workers = workers
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=10_000)
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        if length > MAX_BODY_BYTES:
+            raise ConnectionError("request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, path.split("?", 1)[0], headers, body
+
+    def _write_response(self, writer, status, payload, keep_alive):
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error", 503: "Service Unavailable"}
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {reasons.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+
+    async def _route(self, method, path, body):
+        if path == "/health":
+            return 200, {"status": "ok", "model": self.model_name, "workers": self.workers, "uptime": time.time() - self.started}
+        if path == "/metrics":
+            return 200, self.metrics()
+        if path != "/score":
+            return 404, {"error": f"unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        return await self._score(body)
+
+    async def _score(self, body):
+        start = time.perf_counter()
+        self.requests += 1
+        try:
+            request = json.loads(body)
+            single = "text" in request
+            texts = [request["text"]] if single else request["texts"]
+            if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+                raise ValueError("texts must be a list of strings")
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.errors += 1
+            return 400, {"error": f'expected {{"text": "..."}} or {{"texts": [...]}}: {e}'}
+
+        try:
+            scores = await self.batcher.submit(texts)
+        except QueueFull:
+            self.errors += 1
+            return 503, {"error": "scoring queue is full, retry later"}
+        except Exception as e:
+            self.errors += 1
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+        self.latencies.append(time.perf_counter() - start)
+        return 200, scores[0] if single else {"scores": scores}
+
+    def metrics(self):
+        latencies = list(self.latencies)
+        sizes = list(self.batcher.batch_sizes)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "queue_depth": self.batcher.queue.qsize(),
+            "batches_in_flight": self.batcher.in_flight,
+            "batches": self.batcher.batches,
+            "texts_scored": self.batcher.texts,
+            "mean_batch_size": sum(sizes) / len(sizes) if sizes else 0.0,
+            "latency_ms": {q: 1000 * _percentile(latencies, p) for q, p in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))},
+        }
+
+async def serve(host="127.0.0.1", port=8000, workers=1, max_batch_size=32, max_wait_ms=5.0, max_queue=10_000,
+                model=si.DEFAULT_MODEL, lexicon=None, inflections=False, cache=None, ready=None):
+    """
+    Runs the scoring server until cancelled. `ready`, if given, is an asyncio.Future set to the bound (host, port),
+    which lets tests start the server on port 0.
+    """
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model, lexicon, inflections, cache))
+    # start every worker (and its model) before accepting requests
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.run_in_executor(executor, score_texts, []) for _ in range(workers)])
+
+    batcher = MicroBatcher(executor, max_batch_size=max_batch_size, max_wait=max_wait_ms / 1000, max_in_flight=workers, max_queue=max_queue)
+    batcher.start()
+    app = ScoringServer(batcher, model_name=model if isinstance(model, str) else "", workers=workers)
+    server = await asyncio.start_server(app.handle, host, port)
+    try:
+        if ready is not None:
+            ready.set_result(server.sockets[0].getsockname()[:2])
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+        executor.shutdown(cancel_futures=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the simplicity index over HTTP/JSON with micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1, help="worker processes, each with its own warm model")
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="how long a batch waits for more texts")
+    parser.add_argument("--max-queue", type=int, default=10_000, help="queued texts before requests get 503")
+    parser.add_argument("--model", default=si.DEFAULT_MODEL, help='spaCy model name, or "regex"')
+    parser.add_argument("--lexicon", help="path to the Dale-Chall easy word list")
+    parser.add_argument("--inflections", action="store_true", help="count regular inflections of easy words as easy")
+    parser.add_argument("--cache", help="SQLite score cache shared with other runs")
+    args = parser.parse_args(argv)
+
+    print(f"serving on http://{args.host}:{args.port} ({args.workers} worker(s), model {args.model})", file=sys.stderr)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, workers=max(args.workers, 1), max_batch_size=args.max_batch_size,
+            max_wait_ms=args.max_wait_ms, max_queue=args.max_queue, model=args.model,
+            lexicon=args.lexicon, inflections=args.inflections, cache=args.cache,
+        ))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+
+# ================================================================================================================================================================================================
+# INSTRUCTIONS
+"""
+On-disk cache for scoring results, shared by every process that opens the same file.
+
+Not used directly in most cases: `util_simplicityIndex.set_cache("./results/si_cache.sqlite")` puts it in front of
+`composite_index`, the per-metric functions and `composite_index_batch`.
+"""
+
+
+# ================================================================================================================================================================================================
+# FUNCTIONS
+
+import json
+import os
+import sqlite3
+import time
+
+class ScoreCache:
+    """
+    A key -> JSON value store in SQLite, bounded to `max_entries` rows with least-recently-used eviction.
+
+    # Notes
+    - WAL mode and a busy timeout let several worker processes read and write the same file concurrently.
+    - Each process opens its own connection on first use (including after a fork), so the object can be handed to a Pool.
+    - `hits` / `misses` count lookups made by this process; `stats()` adds the current number of entries.
+    - A hit only refreshes `last_used` when the stored time is older than `touch_interval` seconds, so most reads
+      stay reads and do not queue on SQLite's single write lock. Eviction order is therefore only that precise.
+    """
+
+    def __init__(self, path, max_entries=1_000_000, timeout=30.0, touch_interval=60.0):
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._pid = None
+        self._puts_since_evict = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_pid"] = None
+        return state
+
+    @property
+    def conn(self):
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)")
+            self._pid = os.getpid()
+        return self._conn
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """
+        Returns {key: value} for the keys that are cached
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        stale = []
+        now = time.time()
+        # stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            rows = self.conn.execute(f"SELECT key, value, last_used FROM scores WHERE key IN ({marks})", chunk).fetchall()
+            found.update((key, json.loads(value)) for key, value, _ in rows)
+            stale.extend(key for key, _, last_used in rows if now - last_used >= self.touch_interval)
+        if stale:
+            self._touch(stale, now)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _touch(self, keys, now):
+        # one write transaction for all the keys of a lookup
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                self.conn.execute(f"UPDATE scores SET last_used = ? WHERE key IN ({marks})", [now, *chunk])
+
+    def put(self, key, value):
+        self.put_many({key: value})
+
+    def put_many(self, items):
+        """
+        Stores {key: value}, then evicts the least recently used rows if the cache is over max_entries
+        """
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, json.dumps(value), now) for key, value in items.items()]
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("INSERT OR REPLACE INTO scores (key, value, last_used) VALUES (?, ?, ?)", rows)
+
+        # counting rows is a full scan, so only check every so often
+        self._puts_since_evict += len(rows)
+        if self._puts_since_evict >= max(self.max_entries // 100, 1):
+            self._puts_since_evict = 0
+            self.evict()
+
+    def evict(self):
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            excess = self.conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.conn.execute("DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY last_used LIMIT ?)", (excess,))
+
+    def clear(self):
+        self.conn.execute("DELETE FROM scores")
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -3,29 +3,253 @@
 # INSTRUCTIONS 
 """"
 To use, simply import this script and use `def composite_index(text)`, where text is a string of the document. 
+
+The spaCy model is only loaded on first use. To pick a different one, call `set_model(...)` before scoring:
+- `set_model("en_core_web_md")`: any installed spaCy package name
+- `set_model(nlp)`: a spaCy Language object you already built
+- `set_model("regex")`: pure-Python tokenizer, no spaCy import at all. Starts in milliseconds, but sentence splits differ slightly
+The default can also be set with the SIMPLICITY_MODEL environment variable (useful for worker processes).
 """
 
 
 # ================================================================================================================================================================================================
 # FUNCTIONS 
 
-import spacy
-import pandas as pd 
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+import hashlib
+import json
 import math 
+import itertools
+import multiprocessing
+import os
+import re
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Optional
 
 # Tokenize 
-nlp = spacy.load("en_core_web_sm")
+DEFAULT_MODEL = os.environ.get("SIMPLICITY_MODEL", "en_core_web_sm")
+
+# Bump whenever a change to the counting code changes scores, so cached results are not reused
+METRICS_VERSION = 1
+
+# Batch scoring only needs sentence boundaries and tokens, so the trained components are left out
+# and a rule-based sentencizer splits sentences instead of the dependency parser.
+BATCH_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"]
+
+# Single documents keep the dependency parser for sentence boundaries, but skip the components that do not affect them
+SENTENCE_DISABLE = ["attribute_ruler", "lemmatizer", "ner"]
+
+# PROFILING - opt-in timing of the scoring stages. Off by default; when off, no timer is read and each stage costs one `is None` check.
+PROFILE_STAGES = ("sentence_split", "word_tokenize", "syllables", "lexicon")
+
+class Profiler:
+    """
+    Accumulates wall time and call counts per scoring stage (see PROFILE_STAGES), in this process only.
+
+    ```
+    with si.profiling() as profiler:
+        si.composite_index_batch(articles)
+    print(profiler.summary())
+    ```
+    """
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(PROFILE_STAGES, 0.0)
+        self.calls = dict.fromkeys(PROFILE_STAGES, 0)
+
+    def add(self, stage, seconds):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def report(self):
+        total = sum(self.seconds.values())
+        return {
+            stage: {"seconds": seconds, "calls": self.calls[stage], "share": seconds / total if total else 0.0}
+            for stage, seconds in self.seconds.items()
+        }
+
+    def summary(self):
+        lines = [f"{'stage':<16}{'seconds':>10}{'calls':>10}{'share':>8}"]
+        for stage, row in self.report().items():
+            lines.append(f"{stage:<16}{row['seconds']:>10.4f}{row['calls']:>10}{row['share']:>8.1%}")
+        return "\n".join(lines)
+
+_profiler = None
+
+def enable_profiling(profiler=None):
+    global _profiler
+    _profiler = profiler if profiler is not None else Profiler()
+    return _profiler
+
+def disable_profiling():
+    global _profiler
+    profiler, _profiler = _profiler, None
+    return profiler
+
+@contextmanager
+def profiling(profiler=None):
+    previous = _profiler
+    profiler = enable_profiling(profiler)
+    try:
+        yield profiler
+    finally:
+        if previous is not None:
+            enable_profiling(previous)
+        else:
+            disable_profiling()
+
+def _timed_iter(iterable, stage):
+    """
+    Yields from iterable, charging the time spent producing each item to stage (used around nlp.pipe)
+    """
+    iterator = iter(iterable)
+    while True:
+        start = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        if _profiler is not None:
+            _profiler.add(stage, time.perf_counter() - start)
+        yield item
+
+def _words(doc):
+    """
+    Returns the words of a spaCy Doc/Span, skipping punctuation and whitespace tokens
+    """
+    return [token.text for token in doc if not token.is_punct and not token.is_space]
+
+class SpacyBackend:
+    """
+    Tokenizes with a spaCy model, loaded on first use.
+
+    `model` is either a package name (e.g. "en_core_web_sm") or a pre-built Language object.
+    """
+
+    def __init__(self, model=DEFAULT_MODEL):
+        self.model = model
+        self._nlp = None if isinstance(model, str) else model
+        self._batch_nlp = None
+
+    def __getstate__(self):
+        # A named model is cheaper to reload in a worker process than to pickle
+        state = self.__dict__.copy()
+        if isinstance(self.model, str):
+            state["_nlp"] = state["_batch_nlp"] = None
+        return state
+
+    @property
+    def name(self):
+        if isinstance(self.model, str):
+            return self.model
+        return f"{self.model.meta['lang']}_{self.model.meta['name']}"
+
+    @property
+    def batch_name(self):
+        # The batch pipeline splits sentences differently, so its results are cached separately
+        return f"{self.name}+sentencizer"
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            import spacy
+            self._nlp = spacy.load(self.model)
+        return self._nlp
+
+    @property
+    def batch_nlp(self):
+        """
+        The lightweight (tokenizer + sentencizer) pipeline used for batches
+        """
+        if self._batch_nlp is None:
+            import spacy
+            if isinstance(self.model, str):
+                self._batch_nlp = spacy.load(self.model, exclude=BATCH_EXCLUDE)
+            else:
+                self._batch_nlp = spacy.blank(self.model.lang, vocab=self.model.vocab)
+                self._batch_nlp.tokenizer = self.model.tokenizer
+            self._batch_nlp.add_pipe("sentencizer")
+        return self._batch_nlp
+
+    def sentences(self, text):
+        nlp = self.nlp
+        # disabled per call rather than excluded at load, so `si.nlp` stays the full pipeline for notebooks
+        with nlp.select_pipes(disable=[name for name in SENTENCE_DISABLE if name in nlp.pipe_names]):
+            return [sent.text for sent in nlp(text).sents]
+
+    def words(self, text):
+        # Tokenizer only, no pipeline components. Reuse whichever pipeline is already loaded.
+        nlp = self._nlp if self._nlp is not None else self.batch_nlp
+        return _words(nlp.tokenizer(text))
+
+    def parse_many(self, texts, batch_size=64):
+        docs = self.batch_nlp.pipe(texts, batch_size=batch_size)
+        if _profiler is not None:
+            docs = _timed_iter(docs, "sentence_split")
+        for doc in docs:
+            yield ParsedDocument(doc.text, sentences=[sent.text for sent in doc.sents], backend=self)
+
+# Sentence ends at . ! or ? (optionally followed by a closing quote/bracket), then whitespace, then something
+# that looks like the start of a sentence. Blank lines always end a sentence. Titles (Mr. Dr. St. Ms. Mrs.) never do.
+_SENTENCE_END_RE = re.compile(r"(?:(?<=[.!?])(?<!\b[MDS][rts]\.)(?<!\bMrs\.)|(?<=[.!?][\"'”’)\]]))\s+(?=[\"'“‘(\[]?[A-Z0-9])|\n\s*\n")
+# Runs of letters/digits, keeping internal . , ' joins together (e.g. "2.1", "1,000", "o'clock")
+_WORD_RE = re.compile(r"[^\W_]+(?:[.,'’][^\W_]+)*")
+
+class RegexBackend:
+    """
+    Pure-Python tokenizer for deployments that cannot afford spaCy's startup time.
+
+    # Notes
+    Approximates spaCy's rules: abbreviations such as "Mr." may end a sentence, and contractions/possessives
+    ("don't", "Smith's") count as one word instead of two.
+    """
+
+    name = "regex"
+    batch_name = "regex"
+
+    def sentences(self, text):
+        return [s for s in _SENTENCE_END_RE.split(text) if s.strip()]
+
+    def words(self, text):
+        return _WORD_RE.findall(text)
+
+    def parse_many(self, texts, batch_size=64):
+        for text in texts:
+            yield ParsedDocument(text, backend=self)
+
+_backend = None
+
+def set_model(model=DEFAULT_MODEL):
+    """
+    Selects the tokenizer backend: a spaCy package name, a spaCy Language object, or "regex".
+    Nothing is loaded until the first document is scored.
+    """
+    global _backend
+    if isinstance(model, (SpacyBackend, RegexBackend)):
+        _backend = model
+    elif model == "regex":
+        _backend = RegexBackend()
+    else:
+        _backend = SpacyBackend(model)
+    return _backend
+
+def get_backend():
+    if _backend is None:
+        set_model(DEFAULT_MODEL)
+    return _backend
+
+def __getattr__(name):
+    # `si.nlp` still works for existing notebooks, but only loads the model when accessed
+    if name == "nlp":
+        return get_backend().nlp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def tokenize_sentences(text):
-    doc = nlp(text)
-    return [sent.text for sent in doc.sents]
+    return get_backend().sentences(text)
 
 def tokenize_words(sentence):
-    doc = nlp(sentence.lower())
-    return [token.text for token in doc if not token.is_punct and not token.is_space]
+    return get_backend().words(sentence.lower())
 
 def syllable_count(word: str) -> int :
     """
@@ -51,18 +275,475 @@ def syllable_count(word: str) -> int :
         count += 1
     return count
 
+# Common words the vowel-group heuristic miscounts: mostly consonant + "le" endings, which lose a syllable to
+# the silent-e rule, and adjacent vowels that are pronounced separately ("idea", "being", "video").
+SYLLABLE_EXCEPTIONS = {
+    "able": 2, "table": 2, "simple": 2, "little": 2, "middle": 2, "people": 2, "title": 2, "single": 2,
+    "example": 3, "article": 3, "possible": 3, "available": 4, "vehicle": 3, "circle": 2, "battle": 2,
+    "business": 2, "themselves": 2, "every": 2, "different": 3, "evening": 2,
+    "area": 3, "idea": 3, "ideas": 3, "media": 3, "video": 3, "radio": 3, "period": 3, "create": 2, "created": 3,
+    "science": 2, "quiet": 2, "real": 2, "poem": 2, "lion": 2, "giant": 2, "being": 2, "going": 2,
+    "doing": 2, "seeing": 2, "trying": 2, "saying": 2, "playing": 2, "paying": 2, "staying": 2,
+}
+
+class SyllableEngine:
+    """
+    Counts syllables once per distinct word and remembers the result.
+
+    # Notes
+    - `table` maps word -> syllables. It stops growing at `maxsize` words; words beyond that are still counted, just not stored.
+    - `exceptions` override the heuristic for specific (lowercase) words, e.g. `SyllableEngine(SYLLABLE_EXCEPTIONS)`.
+    - `count_many` counts all unseen words of a batch in one NumPy pass (falls back to `syllable_count` without NumPy).
+    """
+
+    def __init__(self, exceptions=None, maxsize=200_000):
+        self.exceptions = dict(exceptions or {})
+        self.maxsize = maxsize
+        self.table = dict(self.exceptions)
+        exceptions_digest = hashlib.sha1(json.dumps(self.exceptions, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        self.version = exceptions_digest if self.exceptions else "heuristic"
+
+    def count(self, word):
+        syllables = self.table.get(word)
+        if syllables is None:
+            syllables = syllable_count(word)
+            self._store([word], [syllables])
+        return syllables
+
+    def count_many(self, words):
+        """
+        Returns the syllable count of each word, in order
+        """
+        table = self.table
+        missing = list({word for word in words if word not in table})
+        if missing:
+            counts = _syllable_count_vectorized(missing)
+            self._store(missing, counts)
+            extra = dict(zip(missing, counts))
+            return [table.get(word) or extra[word] for word in words]
+        return [table[word] for word in words]
+
+    def total(self, words):
+        """
+        Returns the total syllables over words: one table lookup per token
+        """
+        return sum(self.count_many(words))
+
+    def _store(self, words, counts):
+        room = self.maxsize - len(self.table)
+        if room > 0:
+            self.table.update(zip(words[:room], counts[:room]))
+
+def _syllable_count_vectorized(words):
+    """
+    `syllable_count` for a list of words at once, over a (words x characters) code-point array
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [syllable_count(word) for word in words]
+
+    lengths = np.fromiter((len(word) for word in words), dtype=np.int64, count=len(words))
+    chars = np.array(words, dtype=f"<U{max(int(lengths.max()), 1)}")
+    codes = chars.view(np.uint32).reshape(len(words), -1)  # padded with 0 past each word's end
+
+    is_vowel = np.isin(codes, np.array([ord(v) for v in "aeiouy"], dtype=np.uint32))
+    count = is_vowel[:, 0].astype(np.int64)
+    count += (is_vowel[:, 1:] & ~is_vowel[:, :-1]).sum(axis=1)
+    count -= codes[np.arange(len(words)), np.maximum(lengths - 1, 0)] == ord("e")
+    return np.maximum(count, 1).tolist()
+
+_syllable_engine = None
+
+def set_syllable_engine(exceptions=None, maxsize=200_000):
+    """
+    Replaces the shared SyllableEngine, e.g. `set_syllable_engine(SYLLABLE_EXCEPTIONS)` to apply the exceptions.
+    The default engine has no exceptions, so scores match `syllable_count` exactly.
+    """
+    global _syllable_engine
+    _syllable_engine = exceptions if isinstance(exceptions, SyllableEngine) else SyllableEngine(exceptions, maxsize)
+    return _syllable_engine
+
+def get_syllable_engine():
+    if _syllable_engine is None:
+        set_syllable_engine()
+    return _syllable_engine
+
+@dataclass
+class TextStats:
+    """
+    The totals the three formulas need. Records add up, so stats of parts (paragraphs, chunks on different
+    workers, sentences of a growing summary) can be summed and scored as one: `sum(parts, TextStats())`.
+
+    - `sentences`, `words`, `syllables`, `difficult_words`: Flesch and Dale-Chall (`difficult_words` is None if not counted)
+    - `sentence_words`, `characters`: ARI, which only counts words inside sentences of 2+ words
+    """
+    sentences: int = 0
+    words: int = 0
+    syllables: int = 0
+    difficult_words: Optional[int] = 0
+    sentence_words: int = 0
+    characters: int = 0
+
+    def __add__(self, other):
+        if not isinstance(other, TextStats):
+            return NotImplemented
+        difficult = None if self.difficult_words is None or other.difficult_words is None else self.difficult_words + other.difficult_words
+        return TextStats(
+            self.sentences + other.sentences,
+            self.words + other.words,
+            self.syllables + other.syllables,
+            difficult,
+            self.sentence_words + other.sentence_words,
+            self.characters + other.characters,
+        )
+
+class ParsedDocument:
+    """
+    A document parsed once, holding everything the three metrics need.
+
+    # Notes
+    The backend splits sentences a single time on the original text. Word counts come from the
+    tokenizer alone (no tagger/parser), on lowercased text, exactly as `tokenize_words` sees it:
+    - `sentences` / `sentence_words`: sentences with at least 2 words, and the words inside them (used by ARI and for ASL)
+    - `words`: the words of the whole lowercased text (used by Flesch and Dale-Chall)
+
+    `sentences` lets a caller hand over sentence splits it already produced (e.g. from `nlp.pipe`).
+    """
+
+    def __init__(self, text, sentences=None, backend=None):
+        if backend is None:
+            backend = get_backend()
+        profiler = _profiler
+
+        if sentences is None:
+            if profiler is not None:
+                start = time.perf_counter()
+            sentences = backend.sentences(text)
+            if profiler is not None:
+                profiler.add("sentence_split", time.perf_counter() - start)
+
+        if profiler is not None:
+            start = time.perf_counter()
+        self.text = text
+        self.sentences = []
+        self.sentence_words = []
+        for sentence in sentences:
+            sent_words = backend.words(sentence.lower())
+            if len(sent_words) >= 2:
+                self.sentences.append(sentence)
+                self.sentence_words.extend(sent_words)
+        self.words = backend.words(text.lower())
+        if profiler is not None:
+            profiler.add("word_tokenize", time.perf_counter() - start)
+
+        if profiler is not None:
+            start = time.perf_counter()
+        self.total_sentences = len(self.sentences)
+        self.total_words = len(self.words)
+        self.total_syllables = get_syllable_engine().total(self.words)
+        if profiler is not None:
+            profiler.add("syllables", time.perf_counter() - start)
+        self.total_sentence_words = len(self.sentence_words)
+        self.total_characters = sum(len(word) for word in self.sentence_words)
+
+    def stats(self, difficult_words=True):
+        """
+        Returns the document's TextStats. `difficult_words=False` leaves the Dale-Chall count out (None).
+        """
+        difficult = None
+        if difficult_words:
+            profiler = _profiler
+            if profiler is not None:
+                start = time.perf_counter()
+            easy_words = get_lexicon()
+            difficult = sum(1 for word in self.words if word not in easy_words)
+            if profiler is not None:
+                profiler.add("lexicon", time.perf_counter() - start)
+        return TextStats(self.total_sentences, self.total_words, self.total_syllables, difficult,
+                         self.total_sentence_words, self.total_characters)
+
+def parse_document(text):
+    """
+    Returns a ParsedDocument for text. An existing ParsedDocument is passed through unchanged.
+    """
+    if isinstance(text, ParsedDocument):
+        return text
+    return ParsedDocument(text)
+
+def parse_documents(texts, batch_size=64):
+    """
+    Yields a ParsedDocument for each text, in input order, in this process.
+
+    # Notes
+    With a spaCy backend this runs `nlp.pipe` on the lightweight batch pipeline. Sentences are split by the
+    rule-based sentencizer rather than the parser, so scores can differ slightly from the single-document
+    functions on text with unusual punctuation.
+    """
+    return get_backend().parse_many(texts, batch_size=batch_size)
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _init_stats_worker(backend, lexicon, syllable_engine):
+    global _backend, _lexicon, _syllable_engine
+    _backend, _lexicon, _syllable_engine = backend, lexicon, syllable_engine
+
+def _chunk_stats(texts):
+    # Runs in a worker: parse, count and return only the small TextStats records
+    return [doc.stats() for doc in parse_documents(texts, batch_size=len(texts))]
+
+def parse_stats(texts, batch_size=64, n_process=1):
+    """
+    Yields the TextStats of each text, in input order.
+
+    # Notes
+    n_process > 1 (-1: all cores) sends chunks of batch_size texts to worker processes, which run the whole
+    parse + count step and send back only TextStats. Workers get a copy of the current backend, lexicon and syllable engine.
+    """
+    if n_process == 1:
+        for doc in parse_documents(texts, batch_size=batch_size):
+            yield doc.stats()
+        return
+    processes = None if n_process == -1 else n_process
+    initargs = (get_backend(), get_lexicon(), get_syllable_engine())
+    with multiprocessing.Pool(processes, initializer=_init_stats_worker, initargs=initargs) as pool:
+        for chunk in pool.imap(_chunk_stats, _chunks(texts, batch_size)):
+            yield from chunk
+
+_cache = None
+
+def set_cache(cache=None, max_entries=1_000_000):
+    """
+    Puts a persistent cache in front of every scoring function: a path to an SQLite file (str or os.PathLike), a ScoreCache,
+    or None to turn it off.
+
+    # Notes
+    Entries are keyed by a hash of the text, the tokenizer backend, the lexicon, the syllable engine and METRICS_VERSION,
+    so changing any of them never returns stale scores. Cached texts always include the Dale-Chall count,
+    so the lexicon has to be available while the cache is on. `get_cache().stats()` reports hits and misses.
+    """
+    global _cache
+    if not isinstance(cache, (str, os.PathLike)):
+        _cache = cache
+    else:
+        from util_scoreCache import ScoreCache
+        _cache = ScoreCache(cache, max_entries=max_entries)
+    return _cache
+
+def get_cache():
+    return _cache
+
+def cache_key(text, batch=False):
+    backend = get_backend()
+    parts = [
+        str(METRICS_VERSION),
+        backend.batch_name if batch else backend.name,
+        get_lexicon().version,
+        get_syllable_engine().version,
+        text,
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+def text_stats(text, difficult_words=True, cache=True):
+    """
+    Returns the TextStats of a string or ParsedDocument. TextStats are passed through unchanged.
+    `difficult_words=False` skips the Dale-Chall lexicon lookup (unless the cache is on).
+    `cache=False` bypasses the score cache, for throwaway texts that should not take up cache space.
+    """
+    if isinstance(text, TextStats):
+        return text
+    if cache and _cache is not None and isinstance(text, str):
+        key = cache_key(text)
+        cached = _cache.get(key)
+        if cached is not None:
+            return TextStats(**cached)
+        stats = parse_document(text).stats()
+        _cache.put(key, asdict(stats))
+        return stats
+    return parse_document(text).stats(difficult_words)
+
+class IncrementalStats:
+    """
+    Running TextStats for text that grows at the end, e.g. a summary being generated token by token.
+
+    # Notes
+    Sentences are counted once, when the next one starts. Only the last, still-open sentence is
+    re-tokenized on each update, so an update costs O(new text + open sentence) rather than O(whole text).
+    Counts are per sentence, so they can differ slightly from scoring the full text in one go.
+    Never uses the score cache: the growing prefixes are throwaway texts.
+
+    ```
+    running = si.IncrementalStats()
+    for piece in generated_pieces:
+        running.update(piece)
+        score = si.composite_index(running.stats)
+    ```
+    """
+
+    def __init__(self, text=""):
+        self.closed = TextStats()
+        self.tail = ""
+        self.stats = TextStats()
+        self.update(text)
+
+    def update(self, new_text):
+        self.tail += new_text
+        sentences = get_backend().sentences(self.tail) if self.tail.strip() else []
+        # Reuse the split above for both parts rather than splitting them again
+        if len(sentences) > 1:
+            last_start = self.tail.rfind(sentences[-1])
+            if last_start > 0:
+                self.closed += ParsedDocument(self.tail[:last_start], sentences=sentences[:-1]).stats()
+                self.tail = self.tail[last_start:]
+                sentences = sentences[-1:]
+        tail_stats = ParsedDocument(self.tail, sentences=sentences).stats() if sentences else TextStats()
+        self.stats = self.closed + tail_stats
+        return self.stats
+
+# Dale-Chall easy-word list. Looked up, in order: the path given to `set_lexicon`, the SIMPLICITY_DALE_CHALL_PATH
+# environment variable, ./data/ under the working directory, then data/ at the repo root (next to src/).
+DALE_CHALL_FILENAME = "dale_chall_easy_word_list.txt"
+DALE_CHALL_PATHS = [
+    os.path.join(".", "data", DALE_CHALL_FILENAME),
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", DALE_CHALL_FILENAME),
+]
+
+def _find_lexicon_path(path=None):
+    candidates = [path] if path is not None else [os.environ.get("SIMPLICITY_DALE_CHALL_PATH")] + DALE_CHALL_PATHS
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return candidate
+    raise FileNotFoundError(f"Dale-Chall easy word list not found, tried: {[c for c in candidates if c]}")
+
+def _is_cvc(word):
+    # consonant-vowel-consonant ending, where English doubles the final consonant (stop -> stopped, run -> running)
+    vowels = "aeiou"
+    return len(word) >= 3 and word[-1] not in vowels + "wxy" and word[-2] in vowels and word[-3] not in vowels
+
+def inflected_forms(word):
+    """
+    Returns the plural/-s, -ed and -ing forms of a base word, using regular English spelling rules.
+    Irregular forms (e.g. "ran", "children") are not generated.
+    """
+    forms = set()
+    consonant_y = len(word) >= 2 and word.endswith("y") and word[-2] not in "aeiou"
+
+    # plural / 3rd person
+    if consonant_y:
+        forms.add(word[:-1] + "ies")
+    elif word.endswith(("s", "x", "z", "ch", "sh")) or (word.endswith("o") and word[-2:-1] not in ("", "a", "e", "i", "o", "u")):
+        forms.add(word + "es")
+    else:
+        forms.add(word + "s")
+
+    # past tense
+    if consonant_y:
+        forms.add(word[:-1] + "ied")
+    elif word.endswith("e"):
+        forms.add(word + "d")
+    else:
+        forms.add(word + "ed")
+
+    # present participle
+    if word.endswith("ie"):
+        forms.add(word[:-2] + "ying")
+    elif word.endswith("e") and not word.endswith(("ee", "ye", "oe")):
+        forms.add(word[:-1] + "ing")
+    else:
+        forms.add(word + "ing")
+
+    if _is_cvc(word):
+        forms.update([word + word[-1] + "ed", word + word[-1] + "ing"])
+    return forms
+
+# Function words whose regular "inflections" are unrelated words (she -> shed, be -> bed, we -> wed, the -> thes)
+NOT_INFLECTED = frozenset(["a", "i", "o", "the", "she", "he", "we", "me", "be", "ye", "no", "so", "to", "lo"])
+
+class EasyWordLexicon:
+    """
+    The Dale-Chall easy words as a frozen set, optionally with an inflection index.
+
+    # Notes
+    With `inflections=True`, `base_forms` maps every regular plural/-ed/-ing form to its easy base word
+    (e.g. "dogs" -> "dog", "walked" -> "walk"), so inflected easy words are not counted as difficult.
+    Lookup stays a single dict/set probe per token. Off by default to keep scores comparable with earlier runs.
+    """
+
+    def __init__(self, words, inflections=False):
+        self.words = frozenset(words)
+        self.inflections = inflections
+        self.base_forms = {}
+        if inflections:
+            for base in sorted(self.words - NOT_INFLECTED):
+                for form in inflected_forms(base):
+                    if form not in self.words:
+                        self.base_forms.setdefault(form, base)
+        # Hash the inflection index too, so a change to the inflection rules also changes the cache keys
+        content = "\n".join(sorted(self.words)) + "\n\n" + "\n".join(f"{form} {base}" for form, base in sorted(self.base_forms.items()))
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()[:12]
+        self.version = f"{digest}-{'infl' if inflections else 'base'}"
+
+    @classmethod
+    def from_file(cls, path=None, inflections=False):
+        with open(_find_lexicon_path(path), "r") as f:
+            return cls(f.read().lower().split(), inflections=inflections)
+
+    def __contains__(self, word):
+        return word in self.words or word in self.base_forms
+
+    def __len__(self):
+        return len(self.words)
+
+    def base_form(self, word):
+        return self.base_forms.get(word, word)
+
+_lexicon = None
+
+def set_lexicon(lexicon=None, inflections=False):
+    """
+    Selects the Dale-Chall easy-word lexicon: a file path, an iterable of words, an EasyWordLexicon,
+    or None for the default file. Loaded once and reused by every `dale_chall` call.
+    """
+    global _lexicon
+    if isinstance(lexicon, EasyWordLexicon):
+        _lexicon = lexicon
+    elif lexicon is None or isinstance(lexicon, (str, os.PathLike)):
+        _lexicon = EasyWordLexicon.from_file(lexicon, inflections=inflections)
+    else:
+        _lexicon = EasyWordLexicon(lexicon, inflections=inflections)
+    return _lexicon
+
+def get_lexicon():
+    if _lexicon is None:
+        set_lexicon()
+    return _lexicon
+
+def configure(model=DEFAULT_MODEL, lexicon=None, inflections=False, cache=None):
+    """
+    Sets the model, lexicon and cache in one call, e.g. as a Pool initializer for worker processes
+    """
+    set_model(model)
+    if lexicon is not None or inflections:
+        set_lexicon(lexicon, inflections=inflections)
+    if cache is not None:
+        set_cache(cache)
+
 def flesch_reading_ease(text):
     """
     Flesh_Reading_Ease = 206.835 - (1.015 x ASL) - (84.6 x ASW)
     # Output 
     range for Flesch Reading Ease is between 0 and 100ish, with higher scores indicating easier readability.
     """
-    sentences = tokenize_sentences(text)
-    sentences = [s for s in sentences if len(tokenize_words(s)) >= 2]
-    words = tokenize_words(text)
-    total_sentences = len(sentences)
-    total_words = len(words)
-    total_syllables = sum([syllable_count(word) for word in words])
+    stats = text_stats(text, difficult_words=False)
+    total_sentences = stats.sentences
+    total_words = stats.words
+    total_syllables = stats.syllables
 
     if total_words == 0 or total_sentences == 0:
         return 0
@@ -87,16 +768,12 @@ def dale_chall(text):
     9.0–9.9: easily understood by an average college student
     10.0 and higher: easily understood by college graduates.
     """
-    easy_words_file = "./data/dale_chall_easy_word_list.txt"  # Replace this with the file path containing the 3,000 easy words
-    with open(easy_words_file, "r") as f:
-        easy_words = set(f.read().lower().split())
-
-    sentences = tokenize_sentences(text)
-    sentences = [s for s in sentences if len(tokenize_words(s)) >= 2]
-    words = tokenize_words(text)
-    total_sentences = len(sentences)
-    total_words = len(words)
-    difficult_words = sum([1 for word in words if word not in easy_words])
+    stats = text_stats(text)
+    total_sentences = stats.sentences
+    total_words = stats.words
+    difficult_words = stats.difficult_words
+    if difficult_words is None:
+        raise ValueError("dale_chall needs TextStats with difficult_words counted")
 
     if total_words == 0 or total_sentences == 0:
         return 0
@@ -120,19 +797,13 @@ def ari(text):
     6.0 - 6.9: easily understood by graduate students
     7.0 - 7.9: easily understood by people who have completed a Ph.D. program or equivalent
     """
-    # Tokenize sentences
-    sentences = tokenize_sentences(text)
-    sentences = [s for s in sentences if len(tokenize_words(s)) >= 2]
-    num_sentences = len(sentences)
-
-    # Tokenize words
-    words = []
-    for sentence in sentences:
-        words.extend(tokenize_words(sentence))
-    num_words = len(words)
+    # Sentences and the words inside them
+    stats = text_stats(text, difficult_words=False)
+    num_sentences = stats.sentences
+    num_words = stats.sentence_words
 
     # Compute ARI
-    char_count = sum([len(word) for word in words])
+    char_count = stats.characters
     avg_sentence_length = num_words / num_sentences if num_sentences > 0 else 0
     avg_word_length = char_count / num_words if num_words > 0 else 0
     ari_score = 4.71 * avg_word_length + 0.5 * avg_sentence_length - 21.43
@@ -143,47 +814,173 @@ def ari(text):
 
     return round(ari_score, 1)
 
-def composite_index(text, verbose = 0):
+# NORMALIZATION RANGES - the raw (low, high) range each score is mapped from onto the 0-1 scale
+# Flesch - The score ranges from 0 to 100, with higher scores indicating easier readability.
+# To normalize, we divide the score by 100.
+# Dale - The raw score ranges from around 4.9 to 11.5.
+# To normalize, we subtract a reasonable lower-bound value (4.0) and then divide by the maximum adjusted range (11.5 - 4.0 = 7.5).
+# ARI - The score can range from negative values to positive values (e.g., -6 to 12), but `ari` clips at 0.
+# To normalize, we divide by the maximum adjusted range (18).
+# Dale-Chall and ARI grow with difficulty, so they are flipped (1 - x) to make higher mean simpler.
+COMPONENTS = ("flesch", "dale", "ari")
+NORMALIZATION = {"flesch": (0, 100), "dale": (4, 11.5), "ari": (0, 18)}
+_INVERTED = {"flesch": False, "dale": True, "ari": True}
+
+# INDEX WEIGHTING 
+# If our audience is primarily non-native English speakers, we might want to give more weight to the Dale-Chall score, which specifically accounts for difficult words.
+# For highly technical texts, you might want to prioritize the ARI or Flesch score, as it accounts for the number of characters per word, which can be a good indicator of technical jargon.
+WEIGHTS = (1/3, 1/3, 1/3)
+
+def normalize_scores(flesch, dale, ari_score, ranges=NORMALIZATION):
+    """
+    Returns the (flesch, dale, ari) scores on the 0-1 scale. Works on single scores or NumPy arrays.
+    """
+    normalized = []
+    for name, score in zip(COMPONENTS, (flesch, dale, ari_score)):
+        low, high = ranges[name]
+        scaled = (score - low) / (high - low)
+        normalized.append(1 - scaled if _INVERTED[name] else scaled)
+    return tuple(normalized)
+
+def composite_index(text, verbose = 0, weights = WEIGHTS, ranges = NORMALIZATION):
     """
     Output: a higher value means the text is simpler, and a lower value means the text is more complex
 
+    text can be a string, a ParsedDocument or a TextStats record.
+    To try other weightings over many documents, extract the scores once with `raw_scores` and use `composite_grid`.
     """
+    # Count once, shared by all three metrics
+    text = text_stats(text)
+
     # NORMALIZE scores to 0-1 scale
+    flesch, dale, ari_score = normalize_scores(flesch_reading_ease(text), dale_chall(text), ari(text), ranges)
+
+    index = (weights[0]) * flesch + (weights[1]) * dale + (weights[2]) * ari_score
 
-    # Flesch - The score ranges from 0 to 100, with higher scores indicating easier readability. 
-    # To normalize, we divide the score by 100.
-    flesch = flesch_reading_ease(text) / 100
+    if verbose == 0:
+        return index
     
-    # Dale - The raw score ranges from around 4.9 to 11.5. 
-    # To normalize, we subtract a reasonable lower-bound value (4.0) and then divide by the maximum adjusted range (11.5 - 4.0 = 7.5).
-    dale = 1 - (dale_chall(text) - 4) / 7.5
+    if verbose == 1:
+        return flesch, dale, ari_score, index, weights
+
+def text_stats_batch(texts, batch_size=64, n_process=1):
+    """
+    Returns a list of TextStats for texts, in input order, counted with `parse_stats` (and the cache, if set)
+    """
+    if _cache is not None:
+        return _cached_batch_stats(list(texts), batch_size, n_process)
+    return list(parse_stats(texts, batch_size=batch_size, n_process=n_process))
 
-    # ARI - The score can range from negative values to positive values (e.g., -6 to 12). 
-    # To normalize, we first add 6 to the score, and then divide by the maximum adjusted range (12 + 6 = 18).
-    ari_score = 1 - (ari(text)) / 18  # Normalizing ARI assuming a minimum of -6 and a maximum of 12 for the range
+def composite_index_batch(texts, batch_size=64, n_process=1, verbose=0):
+    """
+    Returns a list of `composite_index` results for texts, in input order.
 
-    # INDEX WEIGHTING 
-    # If our audience is primarily non-native English speakers, we might want to give more weight to the Dale-Chall score, which specifically accounts for difficult words.
-    # For highly technical texts, you might want to prioritize the ARI or Flesch score, as it accounts for the number of characters per word, which can be a good indicator of technical jargon.
+    Use this instead of looping over `composite_index` when scoring a corpus, e.g.
+    `scores = si.composite_index_batch(articles, n_process=-1)`
+    """
+    return [composite_index(stats, verbose=verbose) for stats in text_stats_batch(texts, batch_size, n_process)]
 
-    WEIGHTS = (1/3, 1/3, 1/3)
+def _cached_batch_stats(texts, batch_size, n_process):
+    """
+    TextStats for each text, parsing only the texts missing from the cache
+    """
+    keys = [cache_key(text, batch=True) for text in texts]
+    found = {key: TextStats(**value) for key, value in _cache.get_many(keys).items()}
+    missing = [i for i, key in enumerate(keys) if key not in found]
+    new = {}
+    for i, stats in zip(missing, parse_stats([texts[i] for i in missing], batch_size=batch_size, n_process=n_process)):
+        new[keys[i]] = found[keys[i]] = stats
+    _cache.put_many({key: asdict(stats) for key, stats in new.items()})
+    return [found[key] for key in keys]
 
-    index = (WEIGHTS[0]) * flesch + (WEIGHTS[1]) * dale + (WEIGHTS[2]) * ari_score
+# ================================================================================================================================================================================================
+# COLUMNAR SCORING
+# Parse a corpus once, then try any number of weightings / normalization ranges with NumPy:
+#   raw = si.raw_scores(articles, n_process=-1)                # (documents, 3)
+#   grid = si.composite_grid(raw, weight_vectors)              # (documents, 1, weightings)
 
-    if verbose == 0:
-        return index
-    
-    if verbose == 1:
-        return flesch, dale, ari_score, index, WEIGHTS
+def raw_scores(texts, batch_size=64, n_process=1):
+    """
+    Returns an (n, 3) array of raw Flesch, Dale-Chall and ARI scores (columns in COMPONENTS order).
+    texts can mix strings and TextStats records.
+    """
+    import numpy as np
+    texts = list(texts)
+    parsed = iter(text_stats_batch([t for t in texts if not isinstance(t, TextStats)], batch_size, n_process))
+    stats = [t if isinstance(t, TextStats) else next(parsed) for t in texts]
+    return np.array([[flesch_reading_ease(s), dale_chall(s), ari(s)] for s in stats], dtype=float).reshape(-1, 3)
+
+def normalized_scores(raw, ranges=NORMALIZATION):
+    """
+    Returns the (n, 3) normalized components of an (n, 3) raw score array
+    """
+    import numpy as np
+    raw = np.asarray(raw, dtype=float)
+    return np.column_stack(normalize_scores(raw[:, 0], raw[:, 1], raw[:, 2], ranges))
+
+def composite_indices(components, weights=WEIGHTS):
+    """
+    Returns the composite index of (n, 3) normalized components: shape (n,) for one weight vector, (n, k) for a (k, 3) array
+    """
+    import numpy as np
+    return np.asarray(components, dtype=float) @ np.asarray(weights, dtype=float).T
+
+def composite_grid(raw, weights, ranges=(NORMALIZATION,)):
+    """
+    Returns an (n, len(ranges), k) array: the composite index of every document for every normalization range
+    and each of the k weight vectors in `weights` (k, 3). `ranges` is a sequence of NORMALIZATION-style dicts, or one dict.
+
+    # Notes
+    Normalization is affine (offset + scale * raw), so every (range, weights) pair folds into one column of a
+    (3, len(ranges) * k) coefficient matrix and the whole grid is a single matrix multiply.
+    """
+    import numpy as np
+    if isinstance(ranges, dict):
+        ranges = (ranges,)
+    raw = np.asarray(raw, dtype=float).reshape(-1, 3)
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+
+    scales = np.empty((len(ranges), 3))
+    offsets = np.empty((len(ranges), 3))
+    for r, normalization in enumerate(ranges):
+        for j, name in enumerate(COMPONENTS):
+            low, high = normalization[name]
+            span = high - low
+            if _INVERTED[name]:
+                scales[r, j], offsets[r, j] = -1 / span, 1 + low / span
+            else:
+                scales[r, j], offsets[r, j] = 1 / span, -low / span
+
+    coefficients = scales[:, None, :] * weights[None, :, :]           # (ranges, k, 3)
+    bias = (offsets[:, None, :] * weights[None, :, :]).sum(axis=-1)   # (ranges, k)
+    grid = raw @ coefficients.reshape(-1, 3).T + bias.reshape(-1)
+    return grid.reshape(len(raw), len(ranges), len(weights))
+
+def scores_frame(texts, batch_size=64, n_process=1, weights=WEIGHTS, ranges=NORMALIZATION):
+    """
+    Returns a pandas DataFrame with raw scores, normalized components and the composite index per text
+    """
+    import pandas as pd
+    raw = raw_scores(texts, batch_size, n_process)
+    components = normalized_scores(raw, ranges)
+    return pd.DataFrame({
+        "flesch": raw[:, 0],
+        "dale": raw[:, 1],
+        "ari": raw[:, 2],
+        "norm_flesh": components[:, 0],
+        "norm_dalechall": components[:, 1],
+        "norm_ari": components[:, 2],
+        "index": composite_indices(components, weights),
+    })
 
 # ================================================================================================================================================================================================
 # TESTING
 # The following are article stubs to test the effectiveness of the simplicity scorer
 
-## if main 
-if __name__ == "__main__":
-        
-
+def sample_articles():
+    """
+    Returns the stub articles as (name, text) pairs. Also used by bench_simplicityIndex.py
+    """
     # SAMPLE DOCS
     stub_wikiEcons = ("Economics (wikipedia)", """
     The publication of Adam Smith's The Wealth of Nations in 1776, has been described as "the effective birth of economics as a separate discipline."52 The book identified land, labour, and capital as the three factors of production and the major contributors to a nation's wealth, as distinct from the physiocratic idea that only agriculture was productive. Smith discusses potential benefits of specialization by division of labour, including increased labour productivity and gains from trade, whether between town and country or across countries.53 His "theorem" that "the division of labor is limited by the extent of the market" has been described as the "core of a theory of the functions of firm and industry" and a "fundamental principle of economic organization."54 To Smith has also been ascribed "the most important substantive proposition in all of economics" and foundation of resource-allocation theory – that, under competition, resource owners (of labour, land, and capital) seek their most profitable uses, resulting in an equal rate of return for all uses in equilibrium (adjusted for apparent differences arising from such factors as training and unemployment).In an argument that includes "one of the most famous passages in all economics,"56 Smith represents every individual as trying to employ any capital they might command for their own advantage, not that of the society,a and for the sake of profit, which is necessary at some level for employing capital in domestic industry, and positively related to the value of produce.58 In this: He generally, indeed, neither intends to promote the public interest, nor knows how much he is promoting it. By preferring the support of domestic to that of foreign industry, he intends only his own security; and by directing that industry in such a manner as its produce may be of the greatest value, he intends only his own gain, and he is in this, as in many other cases, led by an invisible hand to promote an end which was no part of his intention. Nor is it always the worse for the society that it was no part of it. By pursuing his own interest he frequently promotes that of the society more effectually than when he really intends to promote it.The Rev. Thomas Robert Malthus (1798) used the concept of diminishing returns to explain low living standards. Human population, he argued, tended to increase geometrically, outstripping the production of food, which increased arithmetically. The force of a rapidly growing population against a limited amount of land meant diminishing returns to labour. The result, he claimed, was chronically low wages, which prevented the standard of living for most of the population from rising above the subsistence level.60 Economist Julian Lincoln Simon has criticized Malthus's conclusions.""")
@@ -230,9 +1027,18 @@ if __name__ == "__main__":
         stub_GQFeatures,
         stub_wiredeview
     ]
+    return texts
+
+## if main 
+if __name__ == "__main__":
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
+    texts = sample_articles()
 
     # SCORING
-    df = pd.DataFrame(columns=["article", "norm_flesh", "norm_dalechall", "norm_ari", "index", "WEIGHTS"])
+    rows = []
     for text in texts: 
         print("===================")
         print(text[0])
@@ -241,16 +1047,16 @@ if __name__ == "__main__":
         print("ARI:", ari(text[1]))
         print("Composite Index:", composite_index(text[1]))
         flesch, dale, ari_score, index, WEIGHTS = composite_index((text[1]), verbose = 1)
-        temp_data = pd.DataFrame({
-            "article": [text[0]],
-            "norm_flesh": [flesch],
-            "norm_dalechall": [dale],
-            "norm_ari": [ari_score],
-            "index": [index],
-            "WEIGHTS": [WEIGHTS],
+        rows.append({
+            "article": text[0],
+            "norm_flesh": flesch,
+            "norm_dalechall": dale,
+            "norm_ari": ari_score,
+            "index": index,
+            "WEIGHTS": WEIGHTS,
         })
 
-        df = pd.concat([df, temp_data], ignore_index=True)
+    df = pd.DataFrame(rows, columns=["article", "norm_flesh", "norm_dalechall", "norm_ari", "index", "WEIGHTS"])
 
     # PLOTTING 
     # Sort the DataFrame by index
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import pytest
+
+# The modules in src/ are imported as top-level scripts, the same way the notebooks use them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import util_simplicityIndex as si
+
+EASY_WORDS = """
+a about after all and as at be big boy by day did dog for from go good had he her here him his home i in is it
+little make man mary new not of on one out play run said school see she so snow that the then there they this
+to two up walk was we went were what when white who will with you
+"""
+
+@pytest.fixture
+def lexicon_path(tmp_path):
+    path = tmp_path / "dale_chall_easy_word_list.txt"
+    path.write_text("\n".join(EASY_WORDS.split()))
+    return str(path)
+
+@pytest.fixture(autouse=True)
+def regex_scorer(lexicon_path):
+    """
+    Every test starts from the regex backend, a small temporary lexicon and no cache/profiling
+    """
+    si.set_model("regex")
+    si.set_lexicon(lexicon_path)
+    si.set_syllable_engine()
+    si.set_cache(None)
+    si.disable_profiling()
+    yield
+    si.set_cache(None)
+    si.disable_profiling()
@@ -0,0 +1,54 @@
+import pathlib
+
+import util_scoreCache
+import util_simplicityIndex as si
+
+TEXT = "The dog went home. It was a good day."
+
+def test_hits_misses_and_lru_eviction(tmp_path):
+    cache = util_scoreCache.ScoreCache(str(tmp_path / "cache.sqlite"), max_entries=3, touch_interval=0)
+    cache.put_many({"a": 1, "b": [2, 3], "c": {"x": 4}})
+    assert cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": [2, 3]}
+    assert cache.get("c") == {"x": 4}
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.get("a")  # "b" is now the least recently used
+    cache.put("d", 5)
+    cache.evict()
+    assert len(cache) == 3
+    assert cache.get("b") is None and cache.get("a") == 1
+    assert cache.stats()["entries"] == 3
+
+def test_hits_only_refresh_old_timestamps(tmp_path):
+    cache = util_scoreCache.ScoreCache(str(tmp_path / "cache.sqlite"), touch_interval=3600)
+    cache.put("a", 1)
+    last_used = cache.conn.execute("SELECT last_used FROM scores").fetchone()[0]
+    cache.get("a")
+    assert cache.conn.execute("SELECT last_used FROM scores").fetchone()[0] == last_used
+    cache.touch_interval = 0
+    cache.get("a")
+    assert cache.conn.execute("SELECT last_used FROM scores").fetchone()[0] > last_used
+
+def test_set_cache_counts_hits_and_accepts_paths(tmp_path):
+    cache = si.set_cache(pathlib.Path(tmp_path) / "cache.sqlite")
+    assert isinstance(cache, util_scoreCache.ScoreCache)
+    score = si.composite_index(TEXT)
+    assert si.composite_index(TEXT) == score
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_cache_key_changes_with_lexicon(tmp_path):
+    cache = si.set_cache(str(tmp_path / "cache.sqlite"))
+    before = si.dale_chall(TEXT)
+    si.set_lexicon(["the", "dog"])
+    after = si.dale_chall(TEXT)
+    assert cache.misses == 2 and cache.hits == 0
+    assert after != before
+    assert after == si.dale_chall(TEXT) and cache.hits == 1
+
+def test_uncached_paths_leave_the_cache_alone(tmp_path):
+    cache = si.set_cache(str(tmp_path / "cache.sqlite"))
+    si.text_stats(TEXT, cache=False)
+    running = si.IncrementalStats()
+    for word in TEXT.split(" "):
+        running.update(word + " ")
+    assert len(cache) == 0 and (cache.hits, cache.misses) == (0, 0)
@@ -0,0 +1,61 @@
+import csv
+import io
+import json
+
+import scoring_simplicityIndex as scoring
+import util_simplicityIndex as si
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+def test_iter_jsonl_ids_and_bad_lines():
+    lines = [
+        json.dumps({"id": 5, "text": "The dog ran."}),
+        "",
+        json.dumps({"text": "No id here."}),
+        "{not json",
+        json.dumps(["a", "list"]),
+        json.dumps({"id": "x", "text": 3}),
+        json.dumps({"id": "y"}),
+    ]
+    items = list(scoring.iter_jsonl(io.StringIO("\n".join(lines) + "\n")))
+    assert items[0] == ("5", None, "The dog ran.")
+    # missing ids never collide with explicit numeric ids
+    assert items[1] == ("line 3", None, "No id here.")
+    assert [item[0] for item in items[2:]] == ["line 4", "line 5", "x", "y"]
+    assert all(len(item) == 2 for item in items[2:])
+
+def test_score_stream_writes_csv_and_resumes(tmp_path):
+    texts = {"a": "The dog went home. It was a good day.", "b": "", "c": "Mary had a little lamb. Its fleece was white as snow."}
+    lines = [json.dumps({"id": doc_id, "text": text}) for doc_id, text in texts.items()] + ["{broken"]
+    output, checkpoint = str(tmp_path / "out.csv"), str(tmp_path / "out.csv.checkpoint")
+
+    counts = scoring.score_stream(scoring.iter_jsonl(io.StringIO("\n".join(lines))), scoring.CsvSink(output), checkpoint, model="regex", chunk_size=2)
+    assert counts == (3, 0, 1)
+    rows = read_csv(output)
+    assert rows[0] == scoring.COLUMNS
+    assert [row[0] for row in rows[1:]] == ["a", "b", "c"]
+    # every score is written as a float, including the int 0 returned for empty text
+    assert rows[2][1:] == [str(float(score)) for score in (0, 0, 0, si.composite_index(""))]
+    assert [float(x) for x in rows[1][1:]] == [si.flesch_reading_ease(texts["a"]), si.dale_chall(texts["a"]), si.ari(texts["a"]), si.composite_index(texts["a"])]
+
+    # a rerun skips what the checkpoint has and appends only the new documents
+    lines.append(json.dumps({"id": "d", "text": "She will play in the snow."}))
+    counts = scoring.score_stream(scoring.iter_jsonl(io.StringIO("\n".join(lines))), scoring.CsvSink(output), checkpoint, model="regex")
+    assert counts == (1, 3, 1)
+    assert [row[0] for row in read_csv(output)[1:]] == ["a", "b", "c", "d"]
+    assert scoring.load_checkpoint(checkpoint) == {"a", "b", "c", "d"}
+
+def test_directory_input_with_processes(tmp_path, lexicon_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "one.txt").write_text("The boy went to school. He was good.")
+    (docs / "two.txt").write_text("A big white dog. It can run.")
+    (docs / "notes.md").write_text("ignored")
+    output = str(tmp_path / "out.csv")
+
+    assert scoring.main([str(docs), "-o", output, "-p", "2", "--model", "regex", "--lexicon", lexicon_path]) == 0
+    rows = read_csv(output)
+    assert [row[0] for row in rows[1:]] == ["one.txt", "two.txt"]
+    assert float(rows[1][4]) == si.composite_index("The boy went to school. He was good.")
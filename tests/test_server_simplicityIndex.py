@@ -0,0 +1,94 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import server_simplicityIndex as srv
+
+async def request(host, port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    status_line, _, response_body = response.partition(b"\r\n\r\n")
+    return int(status_line.split(b" ")[1]), json.loads(response_body)
+
+def run_against_server(lexicon_path, check, **options):
+    async def main():
+        ready = asyncio.get_running_loop().create_future()
+        server = asyncio.create_task(srv.serve(port=0, model="regex", lexicon=lexicon_path, ready=ready, **options))
+        host, port = await asyncio.wait_for(ready, 30)
+        try:
+            return await check(host, port)
+        finally:
+            server.cancel()
+            try:
+                await server
+            except asyncio.CancelledError:
+                pass
+    return asyncio.run(main())
+
+def test_score_health_and_metrics(lexicon_path):
+    async def check(host, port):
+        status, health = await request(host, port, "GET", "/health")
+        assert status == 200 and health["status"] == "ok" and health["model"] == "regex"
+
+        texts = [f"The dog went home {i}. It was a good day." for i in range(20)]
+        responses = await asyncio.gather(*[request(host, port, "POST", "/score", {"text": text}) for text in texts])
+        assert all(status == 200 for status, _ in responses)
+        assert set(responses[0][1]) == {"flesch", "dale", "ari", "index"}
+
+        status, listed = await request(host, port, "POST", "/score", {"texts": texts[:2]})
+        assert status == 200 and listed["scores"] == [responses[0][1], responses[1][1]]
+
+        assert (await request(host, port, "POST", "/score", {"texts": "abc"}))[0] == 400
+        assert (await request(host, port, "POST", "/score", {"other": 1}))[0] == 400
+        assert (await request(host, port, "GET", "/score"))[0] == 405
+        assert (await request(host, port, "GET", "/unknown"))[0] == 404
+
+        status, metrics = await request(host, port, "GET", "/metrics")
+        assert status == 200
+        assert metrics["texts_scored"] == 22
+        assert metrics["queue_depth"] == 0
+        assert metrics["batches"] <= 22 and metrics["mean_batch_size"] >= 1
+        assert metrics["latency_ms"]["p99"] >= metrics["latency_ms"]["p50"] > 0
+
+    run_against_server(lexicon_path, check, workers=2, max_wait_ms=20)
+
+def test_full_queue_returns_503(lexicon_path):
+    async def check(host, port):
+        status, _ = await request(host, port, "POST", "/score", {"texts": ["One two three.", "Four five six."]})
+        assert status == 200
+        status, error = await request(host, port, "POST", "/score", {"texts": ["One two.", "Three four.", "Five six."]})
+        assert status == 503 and "queue" in error["error"]
+
+    run_against_server(lexicon_path, check, max_queue=2)
+
+def test_batches_grow_while_workers_are_busy():
+    def slow_score(texts):
+        time.sleep(0.2)
+        return [len(text) for text in texts]
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            batcher = srv.MicroBatcher(executor, score=slow_score, max_wait=0.001, max_in_flight=1)
+            batcher.start()
+            try:
+                first = asyncio.create_task(batcher.submit(["a"]))
+                await asyncio.sleep(0.02)
+                # the only worker is busy while these trickle in, so they go out as one batch when it frees up
+                rest = []
+                for i in range(1, 11):
+                    rest.append(asyncio.create_task(batcher.submit(["b" * i])))
+                    await asyncio.sleep(0.01)
+                rest = await asyncio.gather(*rest)
+                assert await first == [1]
+                assert rest == [[i] for i in range(1, 11)]
+                assert list(batcher.batch_sizes) == [1, 10]
+            finally:
+                await batcher.stop()
+
+    asyncio.run(main())
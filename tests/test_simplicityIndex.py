@@ -0,0 +1,202 @@
+import os
+import pathlib
+
+import pytest
+
+import util_simplicityIndex as si
+
+EDGE_CASES = [
+    "",
+    "One.",
+    "Hi there.",
+    "Mary had a little lamb. Its fleece was white as snow!\n\nAnd everywhere that Mary went, the lamb was sure to go.",
+    "The intention.The Rev. Thomas Robert Malthus (1798) used the concept... of diminishing returns?",
+]
+
+def texts():
+    return [text for _, text in si.sample_articles()] + EDGE_CASES
+
+# ================================================================================================================================================================================================
+# BASELINE - the scoring code as it was before the single-parse refactor, with the tokenizers passed in
+
+def baseline_syllable_count(word):
+    count = 0
+    vowels = "aeiouy"
+    if word[0] in vowels:
+        count += 1
+    for i in range(1, len(word)):
+        if word[i] in vowels and word[i - 1] not in vowels:
+            count += 1
+    if word.endswith("e"):
+        count -= 1
+    if count == 0:
+        count += 1
+    return count
+
+def baseline_scores(text, tokenize_sentences, tokenize_words, easy_words):
+    sentences = tokenize_sentences(text)
+    sentences = [s for s in sentences if len(tokenize_words(s)) >= 2]
+    words = tokenize_words(text)
+    total_sentences = len(sentences)
+    total_words = len(words)
+
+    if total_words == 0 or total_sentences == 0:
+        flesch = 0
+        dale = 0
+    else:
+        total_syllables = sum([baseline_syllable_count(word) for word in words])
+        flesch = 206.835 - 1.015 * (total_words / total_sentences) - 84.6 * (total_syllables / total_words)
+        difficult_words = sum([1 for word in words if word not in easy_words])
+        dale = 0.1579 * ((difficult_words / total_words) * 100) + 0.0496 * (total_words / total_sentences)
+
+    ari_words = []
+    for sentence in sentences:
+        ari_words.extend(tokenize_words(sentence))
+    char_count = sum([len(word) for word in ari_words])
+    avg_sentence_length = len(ari_words) / total_sentences if total_sentences > 0 else 0
+    avg_word_length = char_count / len(ari_words) if len(ari_words) > 0 else 0
+    ari_score = 4.71 * avg_word_length + 0.5 * avg_sentence_length - 21.43
+    ari_score = 0 if ari_score < 0 else round(ari_score, 1)
+
+    WEIGHTS = (1/3, 1/3, 1/3)
+    index = (WEIGHTS[0]) * (flesch / 100) + (WEIGHTS[1]) * (1 - (dale - 4) / 7.5) + (WEIGHTS[2]) * (1 - (ari_score) / 18)
+    return flesch, dale, ari_score, index
+
+def regex_tokenizers():
+    backend = si.RegexBackend()
+    return backend.sentences, lambda sentence: backend.words(sentence.lower())
+
+def spacy_tokenizers():
+    spacy = pytest.importorskip("spacy")
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    si.set_model(nlp)
+
+    def tokenize_words(sentence):
+        return [token.text for token in nlp(sentence.lower()) if not token.is_punct and not token.is_space]
+    return (lambda text: [sent.text for sent in nlp(text).sents]), tokenize_words
+
+@pytest.mark.parametrize("tokenizers", [regex_tokenizers, spacy_tokenizers])
+def test_scores_match_baseline(tokenizers):
+    tokenize_sentences, tokenize_words = tokenizers()
+    easy_words = set(si.get_lexicon().words)
+    for text in texts():
+        expected = baseline_scores(text, tokenize_sentences, tokenize_words, easy_words)
+        assert (si.flesch_reading_ease(text), si.dale_chall(text), si.ari(text), si.composite_index(text)) == expected
+
+def test_batch_matches_single_document_scores():
+    # the regex backend splits sentences the same way in both paths
+    assert si.composite_index_batch(texts(), batch_size=4, n_process=2) == [si.composite_index(text) for text in texts()]
+
+# ================================================================================================================================================================================================
+# TEXT STATS
+
+def test_text_stats_add_up():
+    first, second = si.TextStats(2, 10, 14, 3, 9, 40), si.TextStats(1, 4, 5, 1, 4, 15)
+    assert first + second == si.TextStats(3, 14, 19, 4, 13, 55)
+    assert sum([first, second], si.TextStats()) == first + second
+    # an uncounted difficult_words stays uncounted
+    assert (first + si.TextStats(difficult_words=None)).difficult_words is None
+
+def test_incremental_stats_match_full_text():
+    for text in texts():
+        for step in (1, 7, 50):
+            running = si.IncrementalStats()
+            for start in range(0, len(text), step):
+                running.update(text[start:start + step])
+            assert running.stats == si.text_stats(text), (step, text[:40])
+    assert si.composite_index(si.IncrementalStats(texts()[0]).stats) == si.composite_index(texts()[0])
+
+# ================================================================================================================================================================================================
+# SYLLABLES
+
+def test_vectorized_syllables_match_syllable_count():
+    pytest.importorskip("numpy")
+    words = sorted({word for text in texts() for word in si.tokenize_words(text)} | {"e", "ye", "queue", "rhythm", "2019"})
+    assert si._syllable_count_vectorized(words) == [si.syllable_count(word) for word in words]
+
+def test_syllable_engine_exceptions():
+    engine = si.SyllableEngine(si.SYLLABLE_EXCEPTIONS)
+    assert engine.count_many(["people", "the", "people"]) == [2, 1, 2]
+    assert si.SyllableEngine().count("people") == si.syllable_count("people")
+
+# ================================================================================================================================================================================================
+# LEXICON
+
+def test_inflected_easy_words_are_easy():
+    lexicon = si.EasyWordLexicon("a the she he we be me use eye go do die tie see bee sea age walk dog".split(), inflections=True)
+    for word in ["dogs", "walked", "walking", "uses", "used", "using", "eyes", "goes", "does", "doing", "going",
+                 "died", "tied", "seeing", "bees", "seas", "aged"]:
+        assert word in lexicon, word
+    # "inflections" of function words are unrelated words, and stay difficult
+    for word in ["thes", "shed", "bed", "wed", "hes", "med"]:
+        assert word not in lexicon, word
+    assert lexicon.base_form("walked") == "walk"
+
+def test_lexicon_version_changes_with_inflection_rules(monkeypatch):
+    words = ["walk", "dog", "she"]
+    version = si.EasyWordLexicon(words, inflections=True).version
+    assert si.EasyWordLexicon(words, inflections=True).version == version
+    assert si.EasyWordLexicon(words).version != version
+    # same words, different rules -> different version, so cached scores are not reused
+    monkeypatch.setattr(si, "NOT_INFLECTED", frozenset())
+    assert si.EasyWordLexicon(words, inflections=True).version != version
+
+def test_lexicon_path_lookup_order(tmp_path, monkeypatch, lexicon_path):
+    env_path = tmp_path / "env" / si.DALE_CHALL_FILENAME
+    env_path.parent.mkdir()
+    env_path.write_text("env")
+    cwd_path = tmp_path / "data" / si.DALE_CHALL_FILENAME
+    cwd_path.parent.mkdir()
+    cwd_path.write_text("cwd")
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setenv("SIMPLICITY_DALE_CHALL_PATH", str(env_path))
+    assert si._find_lexicon_path(lexicon_path) == lexicon_path
+    assert len(si.set_lexicon(pathlib.Path(lexicon_path))) == len(si.set_lexicon(lexicon_path))
+    assert si._find_lexicon_path() == str(env_path)
+    monkeypatch.delenv("SIMPLICITY_DALE_CHALL_PATH")
+    assert os.path.samefile(si._find_lexicon_path(), cwd_path)
+    with pytest.raises(FileNotFoundError):
+        si._find_lexicon_path(str(tmp_path / "missing.txt"))
+
+# ================================================================================================================================================================================================
+# COLUMNAR SCORING
+
+def test_composite_grid_matches_composite_index():
+    pytest.importorskip("numpy")
+    weightings = [si.WEIGHTS, (0.5, 0.25, 0.25), (0.1, 0.8, 0.1)]
+    wide = {"flesch": (-20, 120), "dale": (3, 12), "ari": (0, 24)}
+    raw = si.raw_scores(texts())
+    grid = si.composite_grid(raw, weightings, ranges=(si.NORMALIZATION, wide))
+    assert grid.shape == (len(texts()), 2, len(weightings))
+    for i, text in enumerate(texts()):
+        for r, ranges in enumerate((si.NORMALIZATION, wide)):
+            for k, weights in enumerate(weightings):
+                assert grid[i, r, k] == pytest.approx(si.composite_index(text, weights=weights, ranges=ranges))
+    assert si.composite_grid(raw, si.WEIGHTS, ranges=si.NORMALIZATION).shape == (len(texts()), 1, 1)
+
+# ================================================================================================================================================================================================
+# PROFILING
+
+def test_profiler_counts_every_stage_once_per_document():
+    documents = texts()
+    with si.profiling() as profiler:
+        for text in documents:
+            si.composite_index(text)
+    report = profiler.report()
+    assert list(report) == list(si.PROFILE_STAGES)
+    assert all(row["calls"] == len(documents) for row in report.values())
+    assert all(row["seconds"] > 0 for row in report.values())
+    assert sum(row["share"] for row in report.values()) == pytest.approx(1.0)
+    assert all(stage in profiler.summary() for stage in si.PROFILE_STAGES)
+
+    # nothing is charged once profiling is off, and an outer profiler is restored after a nested one
+    si.composite_index(documents[0])
+    assert profiler.report() == report
+    with si.profiling() as outer:
+        with si.profiling() as inner:
+            si.flesch_reading_ease(documents[0])
+        si.flesch_reading_ease(documents[0])
+    assert inner.calls["sentence_split"] == outer.calls["sentence_split"] == 1
+    assert inner.calls["lexicon"] == 0